@@ -4,8 +4,6 @@ PCA分析の検証スクリプト（pc_visualize_app.pyと同じロジック）
 """
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 
 print("="*80)
 print("【PCA分析検証】pc_visualize_app.pyと同じロジックで検証")
@@ -18,9 +16,12 @@ print(f"価格範囲: {df['price'].min():,.0f}円 ～ {df['price'].max():,.0f}
 
 # 1. 標準化（アプリと同じ）
 feature_cols = ["cpu_score", "gpu_score", "ram_gb", "storage_gb"]
-X = df[feature_cols].values
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
+X = df[feature_cols].to_numpy(dtype=np.float32)
+# standardize_inplace と同じ規則：float64で集計し、分散がほぼ0の列は中心化だけ行う
+mu = X.mean(axis=0, dtype=np.float64)
+sd = np.sqrt(X.var(axis=0, dtype=np.float64))
+sd[sd < 10 * np.finfo(np.float64).eps] = 1.0
+X_scaled = (X - mu.astype(X.dtype)) / sd.astype(X.dtype)
 
 print("\n" + "="*80)
 print("【1. 標準化】")
@@ -28,30 +29,36 @@ print("="*80)
 for i, col in enumerate(feature_cols):
     print(f"{col:15s}: 平均={X_scaled[:, i].mean():.6f}, 標準偏差={X_scaled[:, i].std():.6f}")
 
-# 2. PCA（アプリと同じ）
-pca = PCA(n_components=2)
-pcs = pca.fit_transform(X_scaled)
+# 2. PCA（アプリと同じ：4×4共分散行列の固有値分解）
+cov = (X_scaled.T @ X_scaled) / (X_scaled.shape[0] - 1)
+eigvals, eigvecs = np.linalg.eigh(cov)
+order = eigvals.argsort()[::-1]
+eigvals = eigvals[order]
+components = eigvecs[:, order].T
+# 符号の決定（各主成分の絶対値最大の要素を正にする）
+components *= np.sign(components[np.arange(len(components)), np.abs(components).argmax(axis=1)])[:, None]
+var_ratio = eigvals / eigvals.sum()
+pcs = X_scaled @ components[:2].T
 df["PC1"] = pcs[:, 0]
 df["PC2"] = pcs[:, 1] if pcs.shape[1] > 1 else 0
 
 print("\n" + "="*80)
 print("【2. PCA結果】")
 print("="*80)
-print(f"PC1の説明分散比: {pca.explained_variance_ratio_[0]:.4f} ({pca.explained_variance_ratio_[0]*100:.2f}%)")
-print(f"PC2の説明分散比: {pca.explained_variance_ratio_[1]:.4f} ({pca.explained_variance_ratio_[1]*100:.2f}%)")
-print(f"累積寄与率: {pca.explained_variance_ratio_.sum():.4f} ({pca.explained_variance_ratio_.sum()*100:.2f}%)")
+print(f"PC1の説明分散比: {var_ratio[0]:.4f} ({var_ratio[0]*100:.2f}%)")
+print(f"PC2の説明分散比: {var_ratio[1]:.4f} ({var_ratio[1]*100:.2f}%)")
+print(f"累積寄与率: {var_ratio[:2].sum():.4f} ({var_ratio[:2].sum()*100:.2f}%)")
 
 print("\n固有ベクトル（PC1）:")
 for i, col in enumerate(feature_cols):
-    print(f"  {col:15s}: {pca.components_[0, i]:>7.4f}")
+    print(f"  {col:15s}: {components[0, i]:>7.4f}")
 
 print("\n固有ベクトル（PC2）:")
 for i, col in enumerate(feature_cols):
-    print(f"  {col:15s}: {pca.components_[1, i]:>7.4f}")
+    print(f"  {col:15s}: {components[1, i]:>7.4f}")
 
 # 3. 総合性能の計算（アプリと同じ）
 df["total_perf"] = X_scaled.mean(axis=1)
-df["price_norm"] = (df["price"] - df["price"].min()) / (df["price"].max() - df["price"].min() + 1e-9)
 
 print("\n" + "="*80)
 print("【3. 推薦スコア計算（複数パターン）】")
@@ -65,55 +72,68 @@ test_cases = [
     {"name": "予算無制限", "w_pc2": 0.0, "max_price": float('inf')},
 ]
 
-for test in test_cases:
+# ループ内でDataFrameを作り直さないよう、列をNumPy配列として取り出しておく
+# 価格の昇順に並べ替えておくと、予算内の行は先頭からk件の範囲になる
+price_order = np.argsort(df["price"].to_numpy(), kind="stable")
+prices = df["price"].to_numpy()[price_order]
+pc1 = df["PC1"].to_numpy()[price_order]
+pc2 = df["PC2"].to_numpy()[price_order]
+models = df["model"].to_numpy()[price_order]
+
+# 全テストケースのスコアを (ケース数, N) の行列として一括計算
+max_prices = np.array([t['max_price'] for t in test_cases])
+w2 = np.array([t['w_pc2'] for t in test_cases])[:, None]
+# 予算内の件数を二分探索で求める（予算内がなければ全体）
+ks = np.searchsorted(prices, max_prices, side="right")
+ks[ks == 0] = len(prices)
+masks = np.arange(len(prices))[None, :] < ks[:, None]
+
+# 価格・PC1・PC2を (3, N) にまとめ、min/maxを1回のリダクションで求める
+# 価格は全体、PC1とPC2は予算内の行だけで正規化（アプリと同じロジック）
+stack = np.stack([prices, pc1, pc2]).astype(np.float64)
+stack_masks = np.repeat(masks[:, None, :], 3, axis=1)
+stack_masks[:, 0, :] = True
+vm = np.where(stack_masks, stack[None], np.nan)
+mn = np.nanmin(vm, axis=2, keepdims=True)
+rng = np.nanmax(vm, axis=2, keepdims=True) - mn
+ok = rng > 1e-9
+safe_rng = np.where(ok, rng, 1.0)
+# 正規化と -1～+1 への変換を1回のアフィン変換 a*x + b にまとめる（範囲が0なら0）
+a = np.where(ok, 2.0 / safe_rng, 0.0)
+b = np.where(ok, -(2 * mn + rng) / safe_rng, 0.0)
+scaled = a * stack[None] + b
+df["price_norm"] = ((scaled[0, 0] + 1) / 2)[np.argsort(price_order)]  # 0～1、元の行順に戻す
+pc1_scaled = scaled[:, 1]
+pc2_scaled = scaled[:, 2]
+
+# スコア計算（性能50% + 構成の好み50%）、予算外は選ばれないよう-inf
+scores = np.where(masks, 0.5 * pc1_scaled + 0.5 * w2 * pc2_scaled, -np.inf)
+
+for test, score, mask in zip(test_cases, scores, masks):
     print(f"\n--- {test['name']} (w_pc2={test['w_pc2']:.2f}, 予算≦{test['max_price']:,.0f}円) ---")
     
-    # 予算フィルター
-    df["is_affordable"] = df["price"] <= test['max_price']
-    score_df = df[df["is_affordable"]] if df["is_affordable"].any() else df
+    # 上位3件（全件ソートせずargpartitionで抽出）
+    k = min(3, int(mask.sum()))
+    top = np.argpartition(-score, k - 1)[:k]
+    top = top[np.argsort(-score[top], kind="stable")]
+    best = top[0]
     
-    # PC1とPC2を正規化（アプリと同じロジック）
-    pc1_min = score_df["PC1"].min()
-    pc1_max = score_df["PC1"].max()
-    if pc1_max - pc1_min > 1e-9:
-        pc1_norm = (score_df["PC1"] - pc1_min) / (pc1_max - pc1_min)
-    else:
-        pc1_norm = 0.5
-    
-    pc2_min = score_df["PC2"].min()
-    pc2_max = score_df["PC2"].max()
-    if pc2_max - pc2_min > 1e-9:
-        pc2_norm = (score_df["PC2"] - pc2_min) / (pc2_max - pc2_min)
-        pc2_scaled = (pc2_norm - 0.5) * 2  # -1～+1の範囲に変換
-    else:
-        pc2_scaled = 0
-    
-    # スコア計算（性能50% + 構成の好み50%）
-    df.loc[score_df.index, "score"] = 0.5 * (pc1_norm - 0.5) * 2 + 0.5 * test['w_pc2'] * pc2_scaled
-    
-    # 最高スコアのPC
-    if df["is_affordable"].any():
-        best_pc = df[df["is_affordable"]].sort_values("score", ascending=False).iloc[0]
-    else:
-        best_pc = df.sort_values("score", ascending=False).iloc[0]
-    
-    print(f"🏆 推奨PC: {best_pc['model']}")
-    print(f"   価格: {best_pc['price']:>10,.0f}円")
-    print(f"   スコア: {best_pc['score']:>7.4f}")
-    print(f"   PC1: {best_pc['PC1']:>7.4f}, PC2: {best_pc['PC2']:>7.4f}")
+    print(f"🏆 推奨PC: {models[best]}")
+    print(f"   価格: {prices[best]:>10,.0f}円")
+    print(f"   スコア: {score[best]:>7.4f}")
+    print(f"   PC1: {pc1[best]:>7.4f}, PC2: {pc2[best]:>7.4f}")
     
     # トップ3を表示
-    top3 = df[df["is_affordable"]].sort_values("score", ascending=False).head(3) if df["is_affordable"].any() else df.sort_values("score", ascending=False).head(3)
     print("   トップ3:")
-    for idx, (_, row) in enumerate(top3.iterrows(), 1):
-        print(f"   {idx}. {row['model']:25s} スコア:{row['score']:>7.4f} 価格:{row['price']:>10,.0f}円")
+    for rank, t in enumerate(top, 1):
+        print(f"   {rank}. {models[t]:25s} スコア:{score[t]:>7.4f} 価格:{prices[t]:>10,.0f}円")
 
 print("\n" + "="*80)
 print("【4. PC1とPC2の意味解釈】")
 print("="*80)
 
 # PC1の解釈（すべて正なら総合性能）
-pc1_positive = sum(1 for x in pca.components_[0] if x > 0)
+pc1_positive = sum(1 for x in components[0] if x > 0)
 if pc1_positive == len(feature_cols):
     print("PC1: すべての特徴量と正の相関 → 総合性能を表す軸")
     print("     (ロースペック ↔ ハイスペック)")
@@ -121,7 +141,7 @@ else:
     print("PC1: 特徴量間にトレードオフ関係あり")
 
 # PC2の解釈（対立する特徴を見つける）
-pc2_components = pca.components_[1]
+pc2_components = components[1]
 pos_features = [feature_cols[i] for i, x in enumerate(pc2_components) if x > 0.2]
 neg_features = [feature_cols[i] for i, x in enumerate(pc2_components) if x < -0.2]
 print(f"\nPC2: {', '.join(neg_features) if neg_features else '―'} ↔ {', '.join(pos_features) if pos_features else '―'}")
@@ -1,32 +1,61 @@
 import sys
-import csv
+import hashlib
+import importlib.util
+import json
 import os
+import re
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
-    QVBoxLayout, QHBoxLayout,
+    QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLabel, QLineEdit,
     QFileDialog, QMessageBox, QSlider,
-    QTableWidget, QTableWidgetItem, QTabWidget,
+    QTableWidget, QTableWidgetItem, QTableView, QTabWidget,
     QTextEdit, QFrame, QProgressBar
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QBrush, QColor
 
 # ===== matplotlib optional =====
 HAS_MATPLOTLIB = True
 try:
     import matplotlib.pyplot as plt
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
     from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
     # 日本語フォントの設定 (Windows: MS Gothic, Mac: AppleGothic, etc.)
     plt.rcParams['font.family'] = ['MS Gothic', 'Yu Gothic', 'Meiryo', 'sans-serif']
 except ModuleNotFoundError:
     HAS_MATPLOTLIB = False
 
+# ===== parquet (pyarrow) optional =====
+HAS_PARQUET = True
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:
+    HAS_PARQUET = False
+
+# ===== numba optional =====
+# 読み込みが重く大きなカタログでしか使わないので、有無だけ調べて実際のimportは初回使用時に行う
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 LAST_CSV_FILE = "last_csv_path.txt"
+# 前回CSVのテーブル内容のキャッシュ（起動時にCSVの再パースを省く）
+LAST_CSV_CACHE = "last_csv_cache.parquet"
+# キャッシュのスキーマに記録する元CSVの (パス, mtime_ns, サイズ)
+LAST_CSV_CACHE_SOURCE_KEY = b"pc_visualize.source"
+
+# PCAに使う特徴量（CPU, GPU, RAM, SSD）
+FEATURE_COLS = ["cpu_score", "gpu_score", "ram_gb", "storage_gb"]
+# CSVの数値列（特徴量 + 価格）
+NUMERIC_COLS = FEATURE_COLS + ["price"]
+# フォーム入力の数値形式（符号・小数・指数表記可。nan/infは不可）
+NUMBER_RE = re.compile(r"^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
+# 散布図で予算外のPCを塗る色（lightgray, alpha=0.3）
+OUT_OF_BUDGET_RGBA = (0.827, 0.827, 0.827, 0.3)
 
 # プリセット定義（w_pc1: 性能レベル, w_pc2: 構成バランス）
 PRESETS = {
@@ -101,6 +130,358 @@ class FontSize:
     GRAPH_TITLE = int(14 * FONT_SCALE)
     GRAPH_LEGEND = int(11 * FONT_SCALE)
 
+# ================================
+# パネルのスタイルシート（起動時に一度だけ組み立てる）
+# ================================
+
+# 区切り線
+SEPARATOR_STYLE = "background-color: #BDBDBD;"
+
+# 左パネル（PCA情報）
+PCA_PANEL_STYLE = "background-color: #F5F5F5; padding: 3px;"
+PCA_TITLE_STYLE = f"""
+    font-size: {FontSize.PCA_TITLE}px;
+    font-weight: bold;
+    color: #1976D2;
+    margin-bottom: 3px;
+"""
+PCA_EXPLANATION_STYLE = f"""
+    font-size: {FontSize.PCA_LABEL}px;
+    color: #616161;
+    background-color: #E3F2FD;
+    padding: 5px;
+    border-radius: 5px;
+    border: 1px solid #90CAF9;
+"""
+PCA_LABEL_STYLE = f"font-size: {FontSize.PCA_LABEL}px; font-weight: bold;"
+PCA_PC1_VALUE_STYLE = f"font-size: {FontSize.PCA_VALUE}px; color: #4CAF50; font-weight: bold;"
+PCA_PC1_BAR_STYLE = """
+    QProgressBar {
+        border: 2px solid #4CAF50;
+        border-radius: 5px;
+        background-color: #E0E0E0;
+        height: 15px;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+    }
+"""
+PCA_PC2_VALUE_STYLE = f"font-size: {FontSize.PCA_VALUE}px; color: #2196F3; font-weight: bold;"
+PCA_PC2_BAR_STYLE = """
+    QProgressBar {
+        border: 2px solid #2196F3;
+        border-radius: 5px;
+        background-color: #E0E0E0;
+        height: 15px;
+    }
+    QProgressBar::chunk {
+        background-color: #2196F3;
+    }
+"""
+PCA_CUMSUM_STYLE = f"""
+    font-size: {FontSize.PCA_CUMSUM}px;
+    font-weight: bold;
+    color: #F57C00;
+    background-color: #FFF3E0;
+    padding: 4px;
+    border-radius: 5px;
+"""
+PCA_CONTRIB_TITLE_STYLE = f"font-size: {FontSize.PCA_CONTRIB_TITLE}px; font-weight: bold;"
+PCA_CONTRIB_TABLE_STYLE = f"""
+    QTableWidget {{
+        background-color: white;
+        gridline-color: #E0E0E0;
+        font-size: {FontSize.PCA_TABLE}px;
+    }}
+    QHeaderView::section {{
+        background-color: #1976D2;
+        color: white;
+        font-weight: bold;
+        padding: 3px;
+        font-size: {FontSize.PCA_TABLE}px;
+    }}
+"""
+
+# 右パネル（推奨PC）：結果表示のラベルは分析前はグレー、state="active" で配色を切り替える
+REC_PANEL_STYLE = "background-color: #FAFAFA; padding: 5px;"
+REC_TITLE_STYLE = f"""
+    font-size: {FontSize.REC_TITLE}px;
+    font-weight: bold;
+    color: #FF6F00;
+    margin-bottom: 5px;
+"""
+REC_SUBTITLE_STYLE = f"font-size: {FontSize.REC_SUBTITLE}px; color: #757575; margin-top: -5px; margin-bottom: 5px;"
+REC_PC_NAME_STYLE = f"""
+    QLabel {{
+        font-size: {FontSize.REC_PC_NAME}px;
+        font-weight: bold;
+        color: #757575;
+        background-color: #F1F8E9;
+        padding: 10px;
+        border-radius: 8px;
+        border: 3px solid #FFD700;
+    }}
+    QLabel[state="active"] {{ color: #212121; }}
+"""
+REC_PRICE_STYLE = f"""
+    QLabel {{
+        font-size: {FontSize.REC_PRICE}px;
+        font-weight: bold;
+        color: #757575;
+        margin: 10px 0;
+    }}
+    QLabel[state="active"] {{ color: #FF6F00; }}
+"""
+REC_SPECS_STYLE = f"""
+    QLabel {{
+        font-size: {FontSize.REC_SPECS}px;
+        color: #757575;
+        background-color: white;
+        padding: 6px;
+        border-radius: 5px;
+        border: 1px solid #E0E0E0;
+    }}
+    QLabel[state="active"] {{ color: #616161; }}
+"""
+REC_SCORE_STYLE = f"""
+    QLabel {{
+        font-size: {FontSize.REC_SCORE}px;
+        font-weight: bold;
+        color: #757575;
+        background-color: #E3F2FD;
+        padding: 6px;
+        border-radius: 5px;
+        margin-top: 5px;
+    }}
+    QLabel[state="active"] {{ color: #1976D2; }}
+"""
+REC_PRESET_LABEL_STYLE = f"font-size: {FontSize.REC_PRESET_LABEL}px; font-weight: bold; color: #757575;"
+REC_CURRENT_PRESET_STYLE = f"""
+    font-size: {FontSize.REC_PRESET}px;
+    font-weight: bold;
+    color: white;
+    background-color: #388E3C;
+    padding: 4px;
+    border-radius: 5px;
+"""
+REC_WEIGHT_STYLE = f"""
+    font-size: {FontSize.REC_WEIGHT}px;
+    color: #757575;
+    margin-top: 2px;
+"""
+REC_PRESET_DESC_STYLE = f"""
+    font-size: {FontSize.REC_SUBTITLE}px;
+    color: #616161;
+    font-style: italic;
+    margin-top: 2px;
+"""
+
+# 分析タブ（上部ボタン・プリセットボタン・スライダーのラベル）
+def _main_button_style(color, hover_color):
+    """上部ボタンのスタイル（背景色とホバー時の色）"""
+    return f"""
+    QPushButton {{
+        background-color: {color};
+        color: white;
+        font-size: {FontSize.BTN_MAIN}px;
+        font-weight: bold;
+        border-radius: 5px;
+        padding: 8px 15px;
+    }}
+    QPushButton:hover {{
+        background-color: {hover_color};
+    }}
+"""
+
+
+def _preset_button_style(color):
+    """プリセットボタンのスタイル（選択中は selected="true" のルールで白背景・太枠）"""
+    return f"""
+    QPushButton {{
+        background-color: {color};
+        color: white;
+        font-size: {FontSize.BTN_PRESET}px;
+        font-weight: bold;
+        border-radius: 8px;
+        border: 2px solid {color};
+        padding: 6px 10px;
+    }}
+    QPushButton:hover {{
+        background-color: white;
+        color: {color};
+        border: 3px solid {color};
+    }}
+    QPushButton:pressed {{
+        background-color: #E0E0E0;
+    }}
+    QPushButton[selected="true"] {{
+        background-color: white;
+        color: {color};
+        border: 4px solid {color};
+    }}
+"""
+
+
+ANALYZE_BTN_STYLE = _main_button_style("#2196F3", "#1976D2")
+RELOAD_BTN_STYLE = _main_button_style("#FF9800", "#F57C00")
+PRESET_LABEL_STYLE = f"font-size: {FontSize.PRESET_LABEL}px; font-weight: bold; color: #424242; margin-top: 10px;"
+PRESET_BUTTON_STYLES = {name: _preset_button_style(preset["color"]) for name, preset in PRESETS.items()}
+W_PC1_LABEL_STYLE = f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #4CAF50; min-width: 250px;"
+W_PC2_LABEL_STYLE = f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #2196F3; min-width: 250px;"
+PRICE_LABEL_STYLE = f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #FF6F00; min-width: 200px;"
+
+# ================================
+# PCA計算（標準化と共分散行列の固有値分解）
+# ================================
+
+@dataclass
+class PCAResult:
+    """PCAの結果（sklearnのPCAと同じ属性名で保持）"""
+    components_: np.ndarray
+    explained_variance_ratio_: np.ndarray
+
+
+def standardize_inplace(X):
+    """
+    各列を平均0・標準偏差1に標準化する（XをそのままStandardScalerと同じ規則で書き換える）
+
+    平均・分散はfloat64で集計し、分散0の列は割らずに中心化だけ行う。
+
+    Args:
+        X: 特徴量行列 (N, F)。書き換えられる
+
+    Returns:
+        np.ndarray: 標準化したX（同じ配列）
+    """
+    mu = X.mean(axis=0, dtype=np.float64)
+    sd = np.sqrt(X.var(axis=0, dtype=np.float64))
+    sd[sd < 10 * np.finfo(np.float64).eps] = 1.0
+    X -= mu.astype(X.dtype)
+    X /= sd.astype(X.dtype)
+    return X
+
+
+def compute_pca(X_scaled, n_components=2):
+    """
+    標準化済みデータの共分散行列を固有値分解してPCAを行う
+
+    特徴量は4つ固定なので、N×4のSVDより4×4の固有値分解の方が軽い。
+    符号はsklearnと同じく各主成分の絶対値最大の要素が正になるように揃える。
+
+    Args:
+        X_scaled: 標準化済みの特徴量行列 (N, F)
+        n_components: 主成分の数
+
+    Returns:
+        tuple: (PCAResult, 主成分得点 (N, n_components))
+    """
+    cov = (X_scaled.T @ X_scaled) / max(X_scaled.shape[0] - 1, 1)
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    order = eigvals.argsort()[::-1]
+    eigvals = np.clip(eigvals[order], 0.0, None)
+    components = eigvecs[:, order].T
+    # 符号の決定（sklearnのsvd_flipと同じ規則）
+    max_abs_idx = np.abs(components).argmax(axis=1)
+    signs = np.sign(components[np.arange(components.shape[0]), max_abs_idx])
+    components *= signs[:, None]
+
+    total = eigvals.sum()
+    var_ratio = eigvals / total if total > 0 else np.zeros_like(eigvals)
+    components = components[:n_components]
+    pcs = X_scaled @ components.T
+    return PCAResult(components, var_ratio[:n_components]), pcs
+
+# ================================
+# 推薦スコア計算
+# ================================
+
+# この行数以上のときだけNumba版のスコア計算を使う
+NUMBA_MIN_ROWS = 10_000
+
+
+def _score_best_numpy(pcs, rows, w, scores_out):
+    """NumPy版：対象行の範囲で各軸を-1～+1に変換してスコアを求め、最高スコアの行を返す"""
+    # 部分配列は切り出さず、マスクはwhere=で渡す
+    # 0-1正規化と-1～+1への変換は1回のアフィン変換 (2x - (min+max)) / (max-min) にまとめる
+    # 値の幅がない軸は0とする
+    row_mask = rows[:, None]
+    pc_min = pcs.min(axis=0, where=row_mask, initial=np.inf)
+    pc_range = pcs.max(axis=0, where=row_mask, initial=-np.inf) - pc_min
+    ok = pc_range > 1e-9
+    safe_range = np.where(ok, pc_range, 1.0)
+    pcs_scaled = np.where(ok, (2 * pcs - (2 * pc_min + pc_range)) / safe_range, 0.0)
+    scores = pcs_scaled @ w.astype(pcs_scaled.dtype)
+    np.copyto(scores_out, scores, where=rows)
+    # 対象外の行は-infにして全件ソートせずargmaxで求める
+    return int(np.argmax(np.where(rows, scores, -np.inf)))
+
+
+def _score_best_loop(pcs, rows, w0, w1, scores_out):
+    """Numba版の本体：範囲の計算と、スコア計算＋argmaxをそれぞれ1パスで行う"""
+    n = pcs.shape[0]
+    min0 = min1 = np.inf
+    max0 = max1 = -np.inf
+    for i in range(n):
+        if rows[i]:
+            min0 = min(min0, pcs[i, 0])
+            max0 = max(max0, pcs[i, 0])
+            min1 = min(min1, pcs[i, 1])
+            max1 = max(max1, pcs[i, 1])
+    range0 = max0 - min0
+    range1 = max1 - min1
+    best = -np.inf
+    best_i = 0
+    for i in range(n):
+        if rows[i]:
+            s = 0.0
+            if range0 > 1e-9:
+                s += w0 * (2 * pcs[i, 0] - (2 * min0 + range0)) / range0
+            if range1 > 1e-9:
+                s += w1 * (2 * pcs[i, 1] - (2 * min1 + range1)) / range1
+            scores_out[i] = s
+            if s > best:
+                best = s
+                best_i = i
+    return best_i
+
+
+_score_best_kernel = None
+
+
+def _get_score_best_kernel():
+    """Numba版のカーネルを初回だけimport・JIT化して返す（importできなければNone）"""
+    global _score_best_kernel, HAS_NUMBA
+    if _score_best_kernel is None:
+        # find_specはインストールの有無しか分からないので、実際のimport失敗に備える
+        try:
+            import numba
+        except ImportError:
+            HAS_NUMBA = False
+            return None
+        _score_best_kernel = numba.njit(cache=True)(_score_best_loop)
+    return _score_best_kernel
+
+
+def score_best(pcs, rows, w, scores_out):
+    """
+    推薦スコアを計算し、最高スコアの行番号を返す
+
+    Args:
+        pcs: 主成分得点 (N, 2)
+        rows: スコアを計算する行のマスク (N,)
+        w: 各軸の重み (2,)
+        scores_out: スコアの書き込み先 (N,)。rowsの行だけ更新する
+
+    Returns:
+        int: 最高スコアの行番号
+    """
+    # 小さなカタログではJITコンパイルの時間の方が大きいのでNumPy版を使う
+    if HAS_NUMBA and len(pcs) >= NUMBA_MIN_ROWS:
+        kernel = _get_score_best_kernel()
+        if kernel is not None:
+            return int(kernel(pcs, rows, float(w[0]), float(w[1]), scores_out))
+    return _score_best_numpy(pcs, rows, w, scores_out)
+
 # ================================
 # PCA情報パネル（左側固定）
 # ================================
@@ -111,30 +492,18 @@ class PCAInfoPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.setFixedWidth(180)
-        self.setStyleSheet("background-color: #F5F5F5; padding: 3px;")
+        self.setStyleSheet(PCA_PANEL_STYLE)
         
         layout = QVBoxLayout(self)
         
         # ========== タイトル ==========
         title = QLabel("📊 主成分分析")
-        title.setStyleSheet(f"""
-            font-size: {FontSize.PCA_TITLE}px; 
-            font-weight: bold; 
-            color: #1976D2;
-            margin-bottom: 3px;
-        """)
+        title.setStyleSheet(PCA_TITLE_STYLE)
         layout.addWidget(title)
         
         # ========== 説明テキスト ==========
         self.explanation = QLabel("データ読込後に\n軸の意味を自動判定")
-        self.explanation.setStyleSheet(f"""
-            font-size: {FontSize.PCA_LABEL}px; 
-            color: #616161;
-            background-color: #E3F2FD;
-            padding: 5px;
-            border-radius: 5px;
-            border: 1px solid #90CAF9;
-        """)
+        self.explanation.setStyleSheet(PCA_EXPLANATION_STYLE)
         self.explanation.setWordWrap(True)
         layout.addWidget(self.explanation)
         
@@ -142,83 +511,56 @@ class PCAInfoPanel(QWidget):
         
         # ========== PC1寄与率 ==========
         self.pc1_label = QLabel("PC1寄与率")
-        self.pc1_label.setStyleSheet(f"font-size: {FontSize.PCA_LABEL}px; font-weight: bold;")
+        self.pc1_label.setStyleSheet(PCA_LABEL_STYLE)
         layout.addWidget(self.pc1_label)
         
         self.pc1_value = QLabel("0.0%")
-        self.pc1_value.setStyleSheet(f"font-size: {FontSize.PCA_VALUE}px; color: #4CAF50; font-weight: bold;")
+        self.pc1_value.setStyleSheet(PCA_PC1_VALUE_STYLE)
         layout.addWidget(self.pc1_value)
         
         self.pc1_bar = QProgressBar()
         self.pc1_bar.setRange(0, 100)
         self.pc1_bar.setValue(0)
         self.pc1_bar.setTextVisible(False)
-        self.pc1_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #4CAF50;
-                border-radius: 5px;
-                background-color: #E0E0E0;
-                height: 15px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-            }
-        """)
+        self.pc1_bar.setStyleSheet(PCA_PC1_BAR_STYLE)
         layout.addWidget(self.pc1_bar)
         
         # ========== PC2寄与率 ==========
         layout.addSpacing(5)
         
         self.pc2_label = QLabel("PC2寄与率")
-        self.pc2_label.setStyleSheet(f"font-size: {FontSize.PCA_LABEL}px; font-weight: bold;")
+        self.pc2_label.setStyleSheet(PCA_LABEL_STYLE)
         layout.addWidget(self.pc2_label)
         
         self.pc2_value = QLabel("0.0%")
-        self.pc2_value.setStyleSheet(f"font-size: {FontSize.PCA_VALUE}px; color: #2196F3; font-weight: bold;")
+        self.pc2_value.setStyleSheet(PCA_PC2_VALUE_STYLE)
         layout.addWidget(self.pc2_value)
         
         self.pc2_bar = QProgressBar()
         self.pc2_bar.setRange(0, 100)
         self.pc2_bar.setValue(0)
         self.pc2_bar.setTextVisible(False)
-        self.pc2_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2196F3;
-                border-radius: 5px;
-                background-color: #E0E0E0;
-                height: 15px;
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-            }
-        """)
+        self.pc2_bar.setStyleSheet(PCA_PC2_BAR_STYLE)
         layout.addWidget(self.pc2_bar)
         
         # ========== 累積寄与率 ==========
         layout.addSpacing(3)
         
         self.cumsum_label = QLabel("累積寄与率: 0.0%")
-        self.cumsum_label.setStyleSheet(f"""
-            font-size: {FontSize.PCA_CUMSUM}px; 
-            font-weight: bold; 
-            color: #F57C00;
-            background-color: #FFF3E0;
-            padding: 4px;
-            border-radius: 5px;
-        """)
+        self.cumsum_label.setStyleSheet(PCA_CUMSUM_STYLE)
         layout.addWidget(self.cumsum_label)
         
         # ========== 区切り線 ==========
         layout.addSpacing(8)
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("background-color: #BDBDBD;")
+        separator.setStyleSheet(SEPARATOR_STYLE)
         layout.addWidget(separator)
         layout.addSpacing(3)
         
         # ========== 各スペックの寄与表 ==========
         contrib_title = QLabel("📐 スペックの寄与度")
-        contrib_title.setStyleSheet(f"font-size: {FontSize.PCA_CONTRIB_TITLE}px; font-weight: bold;")
+        contrib_title.setStyleSheet(PCA_CONTRIB_TITLE_STYLE)
         layout.addWidget(contrib_title)
         
         self.contrib_table = QTableWidget(4, 2)
@@ -226,25 +568,24 @@ class PCAInfoPanel(QWidget):
         self.contrib_table.setVerticalHeaderLabels(["CPU", "GPU", "RAM", "SSD"])
         self.contrib_table.horizontalHeader().setStretchLastSection(True)
         self.contrib_table.setMaximumHeight(180)
-        self.contrib_table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: white;
-                gridline-color: #E0E0E0;
-                font-size: {FontSize.PCA_TABLE}px;
-            }}
-            QHeaderView::section {{
-                background-color: #1976D2;
-                color: white;
-                font-weight: bold;
-                padding: 3px;
-                font-size: {FontSize.PCA_TABLE}px;
-            }}
-        """)
+        self.contrib_table.setStyleSheet(PCA_CONTRIB_TABLE_STYLE)
         # 列幅を均等に設定
         self.contrib_table.horizontalHeader().setSectionResizeMode(0, self.contrib_table.horizontalHeader().ResizeMode.Stretch)
         self.contrib_table.horizontalHeader().setSectionResizeMode(1, self.contrib_table.horizontalHeader().ResizeMode.Stretch)
         # 垂直ヘッダーの幅を小さく
         self.contrib_table.verticalHeader().setMaximumWidth(40)
+        # セルは最初に作っておき、更新時はテキストと背景色だけを変える
+        self.contrib_items = [[QTableWidgetItem() for _ in range(2)] for _ in range(4)]
+        for i, row_items in enumerate(self.contrib_items):
+            for j, item in enumerate(row_items):
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.contrib_table.setItem(i, j, item)
+        # 寄与が大きいセルの背景色（列ごとに 正, 負）
+        self._contrib_colors = [
+            (QColor("#C8E6C9"), QColor("#FFCDD2")),  # PC1
+            (QColor("#BBDEFB"), QColor("#FFE0B2")),  # PC2
+        ]
+        self._no_brush = QBrush()
         layout.addWidget(self.contrib_table)
         
         # 下部の余白
@@ -268,35 +609,30 @@ class PCAInfoPanel(QWidget):
         if len(var_ratio) >= 2:
             self.pc2_value.setText(f"{var_ratio[1]*100:.1f}%")
             self.pc2_bar.setValue(int(var_ratio[1]*100))
-            cumsum = np.cumsum(var_ratio)
-            self.cumsum_label.setText(f"累積寄与率: {cumsum[1]*100:.1f}%")
+            cumsum_pc12 = var_ratio[0] + var_ratio[1]
+            self.cumsum_label.setText(f"累積寄与率: {cumsum_pc12*100:.1f}%")
         else:
             self.pc2_value.setText("0.0%")
             self.pc2_bar.setValue(0)
             self.cumsum_label.setText(f"累積寄与率: {var_ratio[0]*100:.1f}%")
         
-        # 寄与度テーブルを更新
-        components = pca.components_
-        features = ['CPU', 'GPU', 'RAM', 'SSD']
-        for i, feature in enumerate(features):
-            # PC1
-            pc1_val = components[0, i]
-            pc1_item = QTableWidgetItem(f"{pc1_val:+.3f}")
-            pc1_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if abs(pc1_val) > 0.4:
-                pc1_item.setBackground(QColor("#C8E6C9") if pc1_val > 0 else QColor("#FFCDD2"))
-            self.contrib_table.setItem(i, 0, pc1_item)
-            
-            # PC2
-            if len(var_ratio) >= 2:
-                pc2_val = components[1, i]
-                pc2_item = QTableWidgetItem(f"{pc2_val:+.3f}")
-                pc2_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if abs(pc2_val) > 0.4:
-                    pc2_item.setBackground(QColor("#BBDEFB") if pc2_val > 0 else QColor("#FFE0B2"))
-                self.contrib_table.setItem(i, 1, pc2_item)
-            else:
-                self.contrib_table.setItem(i, 1, QTableWidgetItem("0.000"))
+        # 寄与度テーブルを更新（強調するセルと符号はまとめて判定）
+        vals = pca.components_[:2]  # (主成分数, 4)
+        n_pc = vals.shape[0]
+        strong = np.abs(vals) > 0.4
+        positive = vals > 0
+        for i, row_items in enumerate(self.contrib_items):
+            for j, item in enumerate(row_items):
+                if j >= n_pc:
+                    item.setText("0.000")
+                    item.setBackground(self._no_brush)
+                    continue
+                item.setText(f"{vals[j, i]:+.3f}")
+                if strong[j, i]:
+                    pos_color, neg_color = self._contrib_colors[j]
+                    item.setBackground(pos_color if positive[j, i] else neg_color)
+                else:
+                    item.setBackground(self._no_brush)
 
 
 # ================================
@@ -309,74 +645,41 @@ class RecommendationPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.setFixedWidth(250)
-        self.setStyleSheet("background-color: #FAFAFA; padding: 5px;")
+        self.setStyleSheet(REC_PANEL_STYLE)
         
         layout = QVBoxLayout(self)
         
         # ========== 総合評価1位PC ==========
         title = QLabel("🏆 あなたへの推奨PC")
-        title.setStyleSheet(f"""
-            font-size: {FontSize.REC_TITLE}px; 
-            font-weight: bold; 
-            color: #FF6F00;
-            margin-bottom: 5px;
-        """)
+        title.setStyleSheet(REC_TITLE_STYLE)
         layout.addWidget(title)
         
         subtitle = QLabel("（嗜好に最も近いPC）")
-        subtitle.setStyleSheet(f"font-size: {FontSize.REC_SUBTITLE}px; color: #757575; margin-top: -5px; margin-bottom: 5px;")
+        subtitle.setStyleSheet(REC_SUBTITLE_STYLE)
         layout.addWidget(subtitle)
         
         # ========== PC名 ==========
         self.pc_name = QLabel("「このデータで分析」をクリック")
-        self.pc_name.setStyleSheet(f"""
-            font-size: {FontSize.REC_PC_NAME}px; 
-            font-weight: bold; 
-            color: #757575;
-            background-color: #F1F8E9;
-            padding: 10px;
-            border-radius: 8px;
-            border: 3px solid #FFD700;
-        """)
+        self.pc_name.setStyleSheet(REC_PC_NAME_STYLE)
         self.pc_name.setWordWrap(True)
         layout.addWidget(self.pc_name)
         
         # ========== 価格（超大きく） ==========
         self.pc_price = QLabel("―――")
-        self.pc_price.setStyleSheet(f"""
-            font-size: {FontSize.REC_PRICE}px; 
-            font-weight: bold; 
-            color: #757575;
-            margin: 10px 0;
-        """)
+        self.pc_price.setStyleSheet(REC_PRICE_STYLE)
         self.pc_price.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.pc_price)
         
         # ========== スペック詳細 ==========
         self.pc_specs = QLabel("分析を実行すると\nスペックが表示されます")
-        self.pc_specs.setStyleSheet(f"""
-            font-size: {FontSize.REC_SPECS}px; 
-            color: #757575;
-            background-color: white;
-            padding: 6px;
-            border-radius: 5px;
-            border: 1px solid #E0E0E0;
-        """)
+        self.pc_specs.setStyleSheet(REC_SPECS_STYLE)
         self.pc_specs.setWordWrap(True)
         self.pc_specs.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.pc_specs)
         
         # ========== スコア ==========
         self.match_score = QLabel("適合スコア: ―")
-        self.match_score.setStyleSheet(f"""
-            font-size: {FontSize.REC_SCORE}px; 
-            font-weight: bold;
-            color: #757575;
-            background-color: #E3F2FD;
-            padding: 6px;
-            border-radius: 5px;
-            margin-top: 5px;
-        """)
+        self.match_score.setStyleSheet(REC_SCORE_STYLE)
         self.match_score.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.match_score)
         
@@ -384,97 +687,62 @@ class RecommendationPanel(QWidget):
         layout.addSpacing(6)
         separator2 = QFrame()
         separator2.setFrameShape(QFrame.Shape.HLine)
-        separator2.setStyleSheet("background-color: #BDBDBD;")
+        separator2.setStyleSheet(SEPARATOR_STYLE)
         layout.addWidget(separator2)
         layout.addSpacing(3)
         
         # ========== 現在のプリセット ==========
         preset_label = QLabel("【選択中のプリセット】")
-        preset_label.setStyleSheet(f"font-size: {FontSize.REC_PRESET_LABEL}px; font-weight: bold; color: #757575;")
+        preset_label.setStyleSheet(REC_PRESET_LABEL_STYLE)
         layout.addWidget(preset_label)
         
         self.current_preset = QLabel("一般ユーザー")
-        self.current_preset.setStyleSheet(f"""
-            font-size: {FontSize.REC_PRESET}px; 
-            font-weight: bold; 
-            color: white;
-            background-color: #388E3C;
-            padding: 4px;
-            border-radius: 5px;
-        """)
+        self.current_preset.setStyleSheet(REC_CURRENT_PRESET_STYLE)
         self.current_preset.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.current_preset)
         
         self.weight_info = QLabel("性能=0%, 構成=0%")
-        self.weight_info.setStyleSheet(f"""
-            font-size: {FontSize.REC_WEIGHT}px; 
-            color: #757575;
-            margin-top: 2px;
-        """)
+        self.weight_info.setStyleSheet(REC_WEIGHT_STYLE)
         self.weight_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.weight_info)
         
         self.preset_desc = QLabel("")
-        self.preset_desc.setStyleSheet(f"""
-            font-size: {FontSize.REC_SUBTITLE}px; 
-            color: #616161;
-            font-style: italic;
-            margin-top: 2px;
-        """)
+        self.preset_desc.setStyleSheet(REC_PRESET_DESC_STYLE)
         self.preset_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preset_desc.setWordWrap(True)
         layout.addWidget(self.preset_desc)
         
+        # 分析結果で配色が変わるラベル（動的プロパティ "state" で切り替える）
+        self._result_labels = (self.pc_name, self.pc_price, self.pc_specs, self.match_score)
+        self._result_styled = False
+        
         # 下部の余白
         layout.addStretch()
     
     def update_recommendation(self, best_pc, preset_name, w_pc1, w_pc2):
         """推奨PC情報を更新"""
-        self.pc_name.setText(best_pc['model'])
-        self.pc_name.setStyleSheet(f"""
-            font-size: {FontSize.REC_PC_NAME}px; 
-            font-weight: bold; 
-            color: #212121;
-            background-color: #F1F8E9;
-            padding: 10px;
-            border-radius: 8px;
-            border: 3px solid #FFD700;
-        """)
+        # 分析後の配色は初回だけ適用（以降はテキストのみ更新）
+        # スタイルシートは再設定せず、プロパティを切り替えて再ポリッシュするだけ
+        if not self._result_styled:
+            for label in self._result_labels:
+                label.setProperty("state", "active")
+                label.style().unpolish(label)
+                label.style().polish(label)
+            self.pc_specs.setAlignment(Qt.AlignmentFlag.AlignLeft)
+            self._result_styled = True
         
+        self.pc_name.setText(best_pc['model'])
         self.pc_price.setText(f"¥{best_pc['price']:,.0f}")
-        self.pc_price.setStyleSheet(f"""
-            font-size: {FontSize.REC_PRICE}px; 
-            font-weight: bold; 
-            color: #FF6F00;
-            margin: 10px 0;
-        """)
         
-        specs_text = f"""CPU: {best_pc['cpu_score']:.0f}
-GPU: {best_pc['gpu_score']:.0f}
-RAM: {best_pc['ram_gb']:.0f} GB
-SSD: {best_pc['storage_gb']:.0f} GB
-総合性能: {best_pc['total_perf']:.2f}"""
-        self.pc_specs.setText(specs_text.strip())
-        self.pc_specs.setStyleSheet(f"""
-            font-size: {FontSize.REC_SPECS}px; 
-            color: #616161;
-            background-color: white;
-            padding: 6px;
-            border-radius: 5px;
-            border: 1px solid #E0E0E0;
-        """)
-        self.pc_specs.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.pc_specs.setText(
+            f"CPU: {best_pc['cpu_score']:.0f}\n"
+            f"GPU: {best_pc['gpu_score']:.0f}\n"
+            f"RAM: {best_pc['ram_gb']:.0f} GB\n"
+            f"SSD: {best_pc['storage_gb']:.0f} GB\n"
+            f"総合性能: {best_pc['total_perf']:.2f}"
+        )
         
         self.match_score.setText(f"適合スコア: {best_pc['score']:.2f}")
-        self.match_score.setStyleSheet(f"""
-            font-size: {FontSize.REC_SCORE}px; 
-            font-weight: bold;
-            color: #1976D2;
-            background-color: #E3F2FD;
-            padding: 6px;
-            border-radius: 5px;
-            margin-top: 5px;
-        """)
         
         self.current_preset.setText(preset_name)
         self.weight_info.setText(f"性能={int(w_pc1*100)}%, 構成={int(w_pc2*100)}%")
@@ -486,6 +754,93 @@ SSD: {best_pc['storage_gb']:.0f} GB
             self.preset_desc.setText("カスタム設定")
 
 
+# ================================
+# CSVテーブルのモデル（DataFrameをそのまま表示）
+# ================================
+
+class CSVTableModel(QAbstractTableModel):
+    """
+    DataFrameを保持してQTableViewに表示するモデル
+
+    セルごとにQTableWidgetItemを作らず、表示時に必要なセルだけを読む。
+    セルの値は入力欄と同じく文字列で保持し、数値変換は分析時に行う。
+    """
+
+    def __init__(self, headers):
+        super().__init__()
+        self.headers = list(headers)
+        self._df = pd.DataFrame(columns=self.headers, dtype=str)
+        self._revision = 0  # 内容を変更するたびに増やす（変換結果のキャッシュ判定用）
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._df.iat[index.row(), index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._df.iat[index.row(), index.column()] = str(value)
+        self._revision += 1
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or row < 0 or row + count > len(self._df):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._df = self._df.drop(self._df.index[row:row + count]).reset_index(drop=True)
+        self._revision += 1
+        self.endRemoveRows()
+        return True
+
+    def dataFrame(self):
+        """保持しているDataFrame（全セル文字列）を返す"""
+        return self._df
+
+    def revision(self):
+        """内容の版番号（編集・行の追加削除・読込のたびに変わる）"""
+        return self._revision
+
+    def setDataFrame(self, df):
+        """DataFrameを丸ごと差し替える（列はヘッダー順に揃え、欠損は空文字）"""
+        self.beginResetModel()
+        self._df = df.reindex(columns=self.headers).fillna("").astype(str).reset_index(drop=True)
+        self._revision += 1
+        self.endResetModel()
+
+    def appendRow(self, values):
+        """末尾に1行追加"""
+        r = len(self._df)
+        self.beginInsertRows(QModelIndex(), r, r)
+        row = pd.DataFrame([list(values)], columns=self.headers, dtype=str)
+        self._df = pd.concat([self._df, row], ignore_index=True)
+        self._revision += 1
+        self.endInsertRows()
+
+    def clear(self):
+        """全行を削除"""
+        self.setDataFrame(pd.DataFrame(columns=self.headers))
+
+
 # ================================
 # CSV 管理タブ（分析用データの唯一の入力元）
 # ================================
@@ -508,15 +863,13 @@ class CSVManager(QWidget):
         self.headers = [f[0] for f in self.fields]
         self.inputs = {}
         
-        # フォーム入力エリア
-        form = QHBoxLayout()
-        for key, label in self.fields:
-            box = QVBoxLayout()
-            box.addWidget(QLabel(label))
+        # フォーム入力エリア（1行目：ラベル、2行目：入力欄の1つのグリッド）
+        form = QGridLayout()
+        for c, (key, label) in enumerate(self.fields):
             edit = QLineEdit()
             self.inputs[key] = edit
-            box.addWidget(edit)
-            form.addLayout(box)
+            form.addWidget(QLabel(label), 0, c)
+            form.addWidget(edit, 1, c)
         
         layout.addLayout(form)
         
@@ -549,9 +902,12 @@ class CSVManager(QWidget):
         
         layout.addLayout(btns)
         
-        # テーブル表示
-        self.table = QTableWidget(0, len(self.fields))
-        self.table.setHorizontalHeaderLabels(self.headers)
+        # テーブル表示（DataFrameを保持するモデルをビューで表示）
+        self.model = CSVTableModel(self.headers)
+        self._df_cache = None  # (モデルの版番号, 数値変換済みDataFrame)
+        self._synced_state = None  # ((パス, 更新時刻, サイズ), モデルの版番号)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         layout.addWidget(self.table)
     
     def add_row(self):
@@ -562,21 +918,18 @@ class CSVManager(QWidget):
             return
 
         # 数値チェック
-        for key in ["cpu_score", "gpu_score", "ram_gb", "storage_gb", "price"]:
-            try:
-                val = float(self.inputs[key].text())
-                if val < 0:
-                    QMessageBox.warning(self, "入力エラー", f"{key} は正の数で入力してください")
-                    return
-            except ValueError:
+        # 例外を使わず、コンパイル済みの正規表現で数値の形式を判定する
+        for key in NUMERIC_COLS:
+            text = self.inputs[key].text()
+            if not NUMBER_RE.match(text):
                 QMessageBox.warning(self, "入力エラー", f"{key} は数値で入力してください")
                 return
+            if float(text) < 0:
+                QMessageBox.warning(self, "入力エラー", f"{key} は正の数で入力してください")
+                return
         
         # 行追加
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        for c, key in enumerate(self.headers):
-            self.table.setItem(r, c, QTableWidgetItem(self.inputs[key].text().strip()))
+        self.model.appendRow(self.inputs[key].text().strip() for key in self.headers)
         
         # フォームをクリア
         for key in self.inputs:
@@ -584,27 +937,30 @@ class CSVManager(QWidget):
     
     def delete_row(self):
         """選択行を削除"""
-        rows = sorted({i.row() for i in self.table.selectedItems()}, reverse=True)
-        for r in rows:
-            self.table.removeRow(r)
+        # 選択セルの行を集合で重複排除し、連続する行はまとめて1回で削除する（後ろから）
+        rows = sorted({i.row() for i in self.table.selectionModel().selectedIndexes()})
+        end = None
+        for r in reversed(rows):
+            if end is None:
+                start = end = r
+            elif r == start - 1:
+                start = r
+            else:
+                self.model.removeRows(start, end - start + 1)
+                start = end = r
+        if end is not None:
+            self.model.removeRows(start, end - start + 1)
             
     def clear_all(self):
         """全行を削除"""
         if QMessageBox.question(self, "確認", "全てのデータを消去しますか？") == QMessageBox.StandardButton.Yes:
-            self.table.setRowCount(0)
-    
-    def _collect_models(self):
-        """テーブル内のモデル名をリスト化"""
-        models = []
-        for r in range(self.table.rowCount()):
-            item = self.table.item(r, 0)
-            models.append(item.text() if item else "")
-        return models
+            self.model.clear()
     
     def _check_duplicates(self):
         """重複モデル名をチェック"""
-        models = self._collect_models()
-        dup = {m for m in models if models.count(m) > 1}
+        # 重複判定はpandasのハッシュ表で1回だけ走査（表示順は最初に現れた順）
+        models = self.model.dataFrame()["model"]
+        dup = models[models.duplicated(keep=False)].unique().tolist()
         if dup:
             QMessageBox.warning(self, "重複エラー", f"重複モデルがあります: {', '.join(dup)}")
             return False
@@ -612,23 +968,34 @@ class CSVManager(QWidget):
     
     def _check_data_validity(self):
         """データの妥当性をチェック"""
-        numeric_cols = [1, 2, 3, 4, 5]  # cpu, gpu, ram, storage, price
-        for r in range(self.table.rowCount()):
-            for c in numeric_cols:
-                item = self.table.item(r, c)
-                val_str = item.text() if item else ""
-                try:
-                    val = float(val_str)
-                    if val < 0:
-                        QMessageBox.warning(self, "エラー", f"行{r+1}, 列{c+1}：正の値を入力してください")
-                        return False
-                    if c == 5 and val == 0: # 価格は0不可
-                        QMessageBox.warning(self, "エラー", f"行{r+1}：価格は0より大きい値を入力してください")
-                        return False
-                except ValueError:
-                    QMessageBox.warning(self, "エラー", f"行{r+1}, 列{c+1}：数値が不正です ({val_str})")
-                    return False
-        return True
+        df = self.model.dataFrame()
+        if df.empty:
+            return True
+        
+        # 数値列をまとめて変換し、不正セルを (行, 列) のマスクで求める
+        # 形式はフォーム入力と同じ正規表現で判定（例外は使わない。inf/nanも不正とする）
+        nums = df[NUMERIC_COLS]
+        well_formed = np.column_stack([nums[col].str.match(NUMBER_RE).to_numpy(dtype=bool) for col in NUMERIC_COLS])
+        vals = np.column_stack([pd.to_numeric(nums[col].where(well_formed[:, i]), errors="coerce").to_numpy(dtype=np.float64)
+                                for i, col in enumerate(NUMERIC_COLS)])
+        not_number = ~well_formed | np.isnan(vals)
+        negative = vals < 0
+        zero_price = np.zeros_like(not_number)
+        zero_price[:, -1] = vals[:, -1] == 0  # 価格は0不可
+        bad = not_number | negative | zero_price
+        if not bad.any():
+            return True
+        
+        # 行優先で最初の不正セルを報告
+        r, i = np.unravel_index(bad.argmax(), bad.shape)
+        c = self.headers.index(NUMERIC_COLS[i])
+        if not_number[r, i]:
+            QMessageBox.warning(self, "エラー", f"行{r+1}, 列{c+1}：数値が不正です ({df.iat[r, c]})")
+        elif negative[r, i]:
+            QMessageBox.warning(self, "エラー", f"行{r+1}, 列{c+1}：正の値を入力してください")
+        else:
+            QMessageBox.warning(self, "エラー", f"行{r+1}：価格は0より大きい値を入力してください")
+        return False
     
     def save_new_csv(self):
         """新規CSVを保存"""
@@ -644,11 +1011,21 @@ class CSVManager(QWidget):
         self._write_csv(path)
         self.current_csv_path = path
         
-        with open(LAST_CSV_FILE, "w", encoding="utf-8") as f:
-            f.write(path)
+        self._save_last_csv_path(path)
         
         QMessageBox.information(self, "保存完了", "CSVを保存しました")
     
+    def _save_last_csv_path(self, path):
+        """前回使用したCSVのパスを保存（同じパスなら書かない。一時ファイル経由で置き換える）"""
+        if os.path.exists(LAST_CSV_FILE):
+            with open(LAST_CSV_FILE, "r", encoding="utf-8") as f:
+                if f.read().strip() == path:
+                    return
+        tmp = LAST_CSV_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(path)
+        os.replace(tmp, LAST_CSV_FILE)
+    
     def load_existing_csv(self):
         """既存CSVを読み込み"""
         path, _ = QFileDialog.getOpenFileName(self, "CSV読込", "", "CSV (*.csv)")
@@ -662,14 +1039,15 @@ class CSVManager(QWidget):
     def load_csv_to_table(self, path):
         """CSVファイルを読み込んでテーブルに表示するヘルパーメソッド"""
         try:
-            df = pd.read_csv(path)
-            self.table.setRowCount(0)
-            for _, row in df.iterrows():
-                r = self.table.rowCount()
-                self.table.insertRow(r)
-                for c, h in enumerate(self.headers):
-                    val = row[h] if h in row else ""
-                    self.table.setItem(r, c, QTableWidgetItem(str(val)))
+            # テーブルは文字列で保持するので型推論はせず、全列を文字列のまま読む
+            df = pd.read_csv(
+                path,
+                usecols=lambda col: col in self.headers,
+                dtype=str,
+                keep_default_na=False,
+            )
+            self.model.setDataFrame(df)
+            self.mark_synced(path)
             return True
         except Exception as e:
             QMessageBox.critical(self, "読込エラー", f"CSVを読み込めません: {e}")
@@ -691,33 +1069,59 @@ class CSVManager(QWidget):
     
     def _write_csv(self, path):
         """CSVをファイルに書き込み"""
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(self.headers)
-            for r in range(self.table.rowCount()):
-                row_data = []
-                for c in range(self.table.columnCount()):
-                    item = self.table.item(r, c)
-                    row_data.append(item.text() if item else "")
-                writer.writerow(row_data)
+        # pandasのCライターで一括書き出し（改行はcsv.writerと同じCRLF）
+        self.model.dataFrame().to_csv(path, index=False, encoding="utf-8", lineterminator="\r\n")
+        self.mark_synced(path)
     
-    def get_dataframe(self):
-        """テーブル内容をDataFrameに変換"""
-        if self.table.rowCount() == 0:
-            return None
-        
-        data = []
-        for r in range(self.table.rowCount()):
-            row = {}
-            for c, h in enumerate(self.headers):
-                item = self.table.item(r, c)
-                row[h] = item.text() if item else ""
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        for col in ["cpu_score", "gpu_score", "ram_gb", "storage_gb", "price"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-        
+    @staticmethod
+    def _file_state(path):
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+    
+    def mark_synced(self, path):
+        """テーブルが今のファイル内容と一致していることを記録"""
+        self._synced_state = (self._file_state(path), self.model.revision())
+    
+    def is_synced(self, path):
+        """前回の読込・保存以降、ファイルもテーブルも変わっていなければTrue"""
+        if self._synced_state is None:
+            return False
+        try:
+            return self._synced_state == (self._file_state(path), self.model.revision())
+        except OSError:
+            return False
+    
+    def get_dataframe(self, with_features=False):
+        """
+        テーブル内容をDataFrameに変換
+
+        with_features=True の場合は (df, X) を返す。
+        X は特徴量行列を列優先（Fortran順）で持つ float32 配列で、
+        標準化・共分散など列方向の集計が連続メモリを走査するようにする。
+        スペック値はfloat32で十分な精度があるため特徴量列はfloat32に落とすが、
+        価格は2^24（約1,677万円）を超えると円単位で丸まるのでfloat64のまま持つ。
+        """
+        if self.model.rowCount() == 0:
+            return (None, None) if with_features else None
+        
+        # テーブルが前回から変わっていなければ数値変換済みのDataFrameを使い回す
+        rev = self.model.revision()
+        if self._df_cache is None or self._df_cache[0] != rev:
+            df = self.model.dataFrame().copy()
+            for col in FEATURE_COLS:
+                df[col] = pd.to_numeric(df[col], errors="coerce", downcast="float")
+            df["price"] = pd.to_numeric(df["price"], errors="coerce").astype(np.float64)
+            self._df_cache = (rev, df)
+        # キャッシュは呼び出し側に変更されないようコピーを返す
+        df = self._df_cache[1].copy()
+        
+        if with_features:
+            # 特徴量行列は呼び出しごとに新しく確保し、列ごとに直接書き込む
+            # （呼び出し側がその場で標準化しても、このオブジェクトの状態は変わらない）
+            X = np.empty((len(df), len(FEATURE_COLS)), dtype=np.float32, order="F")
+            for j, col in enumerate(FEATURE_COLS):
+                X[:, j] = df[col].to_numpy()
+            return df, X
         return df
 
 
@@ -726,6 +1130,9 @@ class CSVManager(QWidget):
 # ================================
 
 class PCApp(QMainWindow):
+    # スライダー操作の再計算を遅らせる時間（ミリ秒）
+    UPDATE_DELAY_MS = 120
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PCコスパ分析 統合アプリ")
@@ -752,37 +1159,13 @@ class PCApp(QMainWindow):
         top_layout = QHBoxLayout()
         analyze_btn = QPushButton("このデータで分析")
         analyze_btn.setMinimumHeight(32)
-        analyze_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #2196F3;
-                color: white;
-                font-size: {FontSize.BTN_MAIN}px;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 8px 15px;
-            }}
-            QPushButton:hover {{
-                background-color: #1976D2;
-            }}
-        """)
+        analyze_btn.setStyleSheet(ANALYZE_BTN_STYLE)
         analyze_btn.clicked.connect(self.analyze_from_manager)
         top_layout.addWidget(analyze_btn)
         
         reload_btn = QPushButton("CSVを再読込")
         reload_btn.setMinimumHeight(32)
-        reload_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #FF9800;
-                color: white;
-                font-size: {FontSize.BTN_MAIN}px;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 8px 15px;
-            }}
-            QPushButton:hover {{
-                background-color: #F57C00;
-            }}
-        """)
+        reload_btn.setStyleSheet(RELOAD_BTN_STYLE)
         reload_btn.clicked.connect(self.reload_csv)
         top_layout.addWidget(reload_btn)
         
@@ -801,6 +1184,7 @@ class PCApp(QMainWindow):
             self.fig, self.ax = plt.subplots(figsize=(6, 4))
             self.canvas = FigureCanvas(self.fig)
             self.canvas.mpl_connect("button_press_event", self.on_point_click)
+            self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
             content_layout.addWidget(self.canvas, 5)  # 50%
         else:
             no_plot_label = QLabel("matplotlib未インストールのため可視化不可")
@@ -816,7 +1200,7 @@ class PCApp(QMainWindow):
         # ========== 下部：プリセット選択 ==========
         preset_container = QVBoxLayout()
         preset_label = QLabel("【プリセット選択】")
-        preset_label.setStyleSheet(f"font-size: {FontSize.PRESET_LABEL}px; font-weight: bold; color: #424242; margin-top: 10px;")
+        preset_label.setStyleSheet(PRESET_LABEL_STYLE)
         preset_container.addWidget(preset_label)
         
         preset_layout = QHBoxLayout()
@@ -826,25 +1210,9 @@ class PCApp(QMainWindow):
             btn = QPushButton(name)
             btn.setMinimumHeight(34)
             btn.setMinimumWidth(90)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {preset['color']};
-                    color: white;
-                    font-size: {FontSize.BTN_PRESET}px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    border: 2px solid {preset['color']};
-                    padding: 6px 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: white;
-                    color: {preset['color']};
-                    border: 3px solid {preset['color']};
-                }}
-                QPushButton:pressed {{
-                    background-color: #E0E0E0;
-                }}
-            """)
+            # 選択状態は動的プロパティ "selected" で切り替える（スタイルシートは一度だけ設定）
+            btn.setProperty("selected", False)
+            btn.setStyleSheet(PRESET_BUTTON_STYLES[name])
             btn.clicked.connect(lambda checked, n=name: self.apply_preset(n))
             self.preset_buttons[name] = btn
             preset_layout.addWidget(btn)
@@ -859,7 +1227,7 @@ class PCApp(QMainWindow):
         # PC1（性能レベル）スライダー
         w_pc1_layout = QHBoxLayout()
         self.w_pc1_label = QLabel("PC1: 0% (データ読込後に表示)")
-        self.w_pc1_label.setStyleSheet(f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #4CAF50; min-width: 250px;")
+        self.w_pc1_label.setStyleSheet(W_PC1_LABEL_STYLE)
         w_pc1_layout.addWidget(self.w_pc1_label)
         
         self.w_pc1 = QSlider(Qt.Orientation.Horizontal)
@@ -893,7 +1261,7 @@ class PCApp(QMainWindow):
         # PC2（構成バランス）スライダー（データ読込後に動的ラベルが設定される）
         w_pc2_layout = QHBoxLayout()
         self.w_pc2_label = QLabel("PC2: 0% (データ読込後に表示)")
-        self.w_pc2_label.setStyleSheet(f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #2196F3; min-width: 250px;")
+        self.w_pc2_label.setStyleSheet(W_PC2_LABEL_STYLE)
         w_pc2_layout.addWidget(self.w_pc2_label)
         
         self.w_pc2 = QSlider(Qt.Orientation.Horizontal)
@@ -926,7 +1294,7 @@ class PCApp(QMainWindow):
         # 価格フィルタースライダー
         price_filter_layout = QHBoxLayout()
         self.price_label = QLabel("予算上限: 無制限")
-        self.price_label.setStyleSheet(f"font-size: {FontSize.SLIDER_LABEL}px; font-weight: bold; color: #FF6F00; min-width: 200px;")
+        self.price_label.setStyleSheet(PRICE_LABEL_STYLE)
         price_filter_layout.addWidget(self.price_label)
 
         self.price_slider = QSlider(Qt.Orientation.Horizontal)
@@ -950,15 +1318,47 @@ class PCApp(QMainWindow):
                 border-radius: 10px;
             }
         """)
-        self.price_slider.valueChanged.connect(self.on_weight_changed)
+        # 予算はドラッグ途中の値で再計算する必要がないので、離した時だけ値を確定させる
+        # （ドラッグ中はラベルだけ追従させる）
+        self.price_slider.setTracking(False)
+        self.price_slider.valueChanged.connect(self.on_price_changed)
+        self.price_slider.sliderMoved.connect(self._update_price_label)
         price_filter_layout.addWidget(self.price_slider)
         price_filter_layout.addStretch()
 
         slider_container.addLayout(price_filter_layout)
         main_layout.addLayout(slider_container)
+        
+        # スライダー変更時の再計算をまとめるタイマー
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._do_full_update)
+        for slider in (self.w_pc1, self.w_pc2):
+            slider.sliderReleased.connect(self._flush_pending_update)
     
     def on_weight_changed(self, value):
         """スライダーが変更された時の共通処理"""
+        # ラベルはすぐ更新し、重い再計算・再描画はタイマーでまとめて行う
+        self._update_slider_labels()
+        
+        # 手動操作時はプリセット選択を解除
+        if not self.signals_blocked():
+            self.current_preset_name = "カスタム"
+        
+        # ドラッグ中の連続した変更は最後の1回だけ反映する
+        self._update_timer.start(self.UPDATE_DELAY_MS)
+
+    def on_price_changed(self, value):
+        """予算スライダーの値が確定した時の処理"""
+        # トラッキング無効なのでドラッグは離した時の1回にまとまっており、遅らせずに反映する
+        # （離した時のsliderReleasedはvalueChangedより先に届くため、タイマーの保留解除には使えない）
+        self._update_slider_labels()
+        if not self.signals_blocked():
+            self.current_preset_name = "カスタム"
+        self._do_full_update()
+
+    def _update_slider_labels(self):
+        """スライダーのラベル表示を更新"""
         # 動的に生成されたPC1の軸ラベルを使用（データ読込前はデフォルト値）
         pc1_desc = getattr(self, "pc1_desc", "性能レベル")
         pc2_desc = getattr(self, "pc2_desc", "構成バランス")
@@ -997,28 +1397,42 @@ class PCApp(QMainWindow):
         else:
             self.w_pc2_label.setText(f"PC2: {balance_val}%")
         
-        p_val = self.price_slider.value()
+        self._update_price_label(self.price_slider.value())
+
+    def _update_price_label(self, p_val):
+        """予算スライダーのラベル表示を更新"""
         if p_val == 100:
             self.price_label.setText("予算上限: 無制限")
         else:
             self.price_label.setText(f"予算上限: {p_val}万円")
 
-        # 手動操作時はプリセット選択を解除
-        if not self.signals_blocked():
-            self.current_preset_name = "カスタム"
-        
-        # PCAは再実行せず、スコア計算と描画のみ更新
+    def _do_full_update(self):
+        """スコア計算と描画の更新（PCAは再実行しない）"""
+        self._update_timer.stop()
         if hasattr(self, "df"):
-            self._calculate_scores_and_pareto()
-            self._update_visualization()
+            if self._calculate_scores_and_pareto():
+                self._update_visualization()
             self._update_info_panels()
 
+    def _flush_pending_update(self):
+        """スライダーを離した時、保留中の更新があればすぐに反映"""
+        if self._update_timer.isActive():
+            self._do_full_update()
+
     def signals_blocked(self):
         return self.w_pc1.signalsBlocked() or self.w_pc2.signalsBlocked() or self.price_slider.signalsBlocked()
     
     def apply_preset(self, preset_name):
         """プリセット選択時の処理"""
         preset = PRESETS[preset_name]
+        
+        # 選択中のプリセットを押し直しただけなら何もしない（保留中の更新もない場合）
+        if (preset_name == self.current_preset_name
+                and self.w_pc1.value() == preset["w_pc1"]
+                and self.w_pc2.value() == preset["w_pc2"]
+                and self.price_slider.value() == 100
+                and not self._update_timer.isActive()):
+            return
         self.current_preset_name = preset_name
         
         # スライダーを更新（シグナルを一時停止して無限ループを防ぐ）
@@ -1035,12 +1449,15 @@ class PCApp(QMainWindow):
         self.price_slider.blockSignals(False)
         
         # ラベル更新と分析結果の更新（PCAは再実行しない）
-        self.on_weight_changed(0)
+        self._update_slider_labels()
+        self._do_full_update()
     
     def reload_csv(self):
         """CSVタブのデータを再読込"""
-        if self.csv_tab.current_csv_path and os.path.exists(self.csv_tab.current_csv_path):
-            if self.csv_tab.load_csv_to_table(self.csv_tab.current_csv_path):
+        path = self.csv_tab.current_csv_path
+        if path and os.path.exists(path):
+            # ファイルもテーブルも前回の読込から変わっていなければ再パースしない
+            if self.csv_tab.is_synced(path) or self.csv_tab.load_csv_to_table(path):
                 QMessageBox.information(self, "再読込完了", "CSVを再読込しました")
                 self.analyze_from_manager()
         else:
@@ -1054,16 +1471,18 @@ class PCApp(QMainWindow):
         if not self.csv_tab._check_data_validity():
             return
             
-        df = self.csv_tab.get_dataframe()
+        df, X = self.csv_tab.get_dataframe(with_features=True)
         if df is None or len(df) < 2:
             QMessageBox.warning(self, "警告", "分析には少なくとも2台以上のPCデータが必要です")
             return
         
         try:
-            self.df = df.copy()
-            self._run_pca()
+            # get_dataframeは呼び出しごとに専用のコピーを返すので、ここでは複製しない
+            self.df = df
+            self._run_pca(X)
             self._calculate_scores_and_pareto()
             self._update_visualization()
+            self._update_pca_panel()
             self._update_info_panels()
         except Exception as e:
             QMessageBox.critical(self, "分析エラー", f"分析中にエラーが発生しました: {e}")
@@ -1117,30 +1536,75 @@ class PCApp(QMainWindow):
         
         return "特徴なし"
 
-    def _run_pca(self):
+    def _run_pca(self, X=None):
         """PCA（主成分分析）の実行：総合性能と構成バランスを抽出"""
-        features = ["cpu_score", "gpu_score", "ram_gb", "storage_gb"]
         feature_display_names = ["CPU", "GPU", "RAM", "SSD"]
-        X = self.df[features].values
-        
-        # 1. 標準化（各特徴量のスケールを揃える）
-        self.scaler = StandardScaler()
-        X_scaled = self.scaler.fit_transform(X)
-        
-        # 2. PCA実行（行中心化なし：素直にデータの分散を見る）
-        # PC1: 通常は全特徴量の総合力（総合性能）
-        # PC2: 特徴量間の対立軸（例：GPU重視 vs CPU重視）
-        n_comp = min(2, X_scaled.shape[0], X_scaled.shape[1])
-        self.pca = PCA(n_components=n_comp)
-        pcs = self.pca.fit_transform(X_scaled)
-        
-        self.df["PC1"] = pcs[:, 0]
-        self.df["PC2"] = pcs[:, 1] if pcs.shape[1] > 1 else 0
+        if X is None:
+            X = np.array(self.df[FEATURE_COLS], dtype=np.float32, order="F")
+        
+        # 同じデータなら前回のフィット結果を再利用（CSV未変更での再分析）
+        # X.tobytes()のコピーを作らず、メモリ上の並び（列優先ならX.T）をそのままハッシュする
+        data_hash = hashlib.blake2b(X.T if X.flags.f_contiguous else X, digest_size=16).digest()
+        cache = getattr(self, "_pca_cache", None)
+        if cache is not None and cache[0] == data_hash:
+            _, self.pca, pcs, total_perf = cache
+        else:
+            # 1. 標準化（各特徴量のスケールを揃える）
+            # Xは分析用の専用コピーなのでその場で標準化する
+            X_scaled = standardize_inplace(X)
+            
+            # 2. PCA実行（行中心化なし：素直にデータの分散を見る）
+            # PC1: 通常は全特徴量の総合力（総合性能）
+            # PC2: 特徴量間の対立軸（例：GPU重視 vs CPU重視）
+            n_comp = min(2, X_scaled.shape[0], X_scaled.shape[1])
+            self.pca, pcs = compute_pca(X_scaled, n_comp)
+            
+            # 総合性能は標準化後の値の行平均（フィットと同時に1回だけ求める）
+            total_perf = X_scaled.mean(axis=1)
+            self._pca_cache = (data_hash, self.pca, pcs, total_perf)
+        
+        # 主成分得点・寄与率を保持（スライダー操作ではPCAも射影も再計算しない）
+        if pcs.shape[1] < 2:
+            pcs = np.column_stack([pcs[:, 0], np.zeros(len(pcs), dtype=pcs.dtype)])
+        self._pcs = pcs
+        self._var_ratio = self.pca.explained_variance_ratio_
+        self._price_arr = price = self.df["price"].to_numpy()
+        self._plot_dirty = True  # 次の描画で散布図を作り直す
         
         # 3. 総合性能（サイズ用）と価格（色用）の準備
         # 総合性能は標準化後の値の平均を使用（スケールを揃えた上で平均）
-        self.df["total_perf"] = X_scaled.mean(axis=1)
-        self.df["price_norm"] = (self.df["price"] - self.df["price"].min()) / (self.df["price"].max() - self.df["price"].min() + 1e-9)
+        # 列の追加は1回のassignにまとめる（列ごとの挿入を繰り返さない）
+        # 価格の最小・最大はCSVを読み直すまで変わらないのでここで1回だけ求める（正規化・カラーバー用）
+        self._price_min = price_min = float(price.min())
+        self._price_max = price_max = float(price.max())
+        self.df = self.df.assign(
+            PC1=pcs[:, 0],
+            PC2=pcs[:, 1],
+            total_perf=total_perf,
+            price_norm=(price - price_min) / (price_max - price_min + 1e-9),
+        )
+        
+        # 表示用に1行分を取り出すための列ごとの配列
+        self._columns = {col: self.df[col].to_numpy() for col in self.df.columns}
+        
+        # 予算判定とスコアはスライダー操作のたびに変わるのでDataFrameには持たず配列で保持する
+        # （スコアは予算内の行だけ更新する）
+        self._affordable = np.ones(len(price), dtype=bool)
+        self._scores = np.full(len(price), np.nan, dtype=pcs.dtype)
+        # データが変わったのでスコアと右パネルは必ず更新する
+        self._last_score_key = None
+        self._last_rec_key = None
+        
+        # マーカーサイズは総合性能だけで決まるので、スライダー操作のたびには計算しない
+        # total_perfを正規化して適切なサイズ範囲にマッピング
+        perf_min = total_perf.min()
+        perf_range = total_perf.max() - perf_min
+        if perf_range > 1e-9:
+            perf_norm = (total_perf - perf_min) / perf_range
+        else:
+            perf_norm = np.full(len(total_perf), 0.5)
+        self._plot_sizes = 20 + perf_norm * 80  # 散布図：20から100の範囲
+        self._best_sizes = 50 + perf_norm * 150  # 推奨PC：50から200の範囲で目立たせる
 
         # 4. 軸の意味を動的に判定（データから自動生成）
         self.pc1_desc = self._generate_dynamic_label(
@@ -1156,7 +1620,12 @@ class PCApp(QMainWindow):
             self.pc2_desc = "なし"
 
     def _calculate_scores_and_pareto(self):
-        """嗜好ベクトルによる推薦スコアの計算"""
+        """
+        嗜好ベクトルによる推薦スコアの計算
+
+        Returns:
+            bool: 再計算した場合True（重みと予算が前回と同じなら何もせずFalse）
+        """
         w_pc1 = self.w_pc1.value() / 100.0
         w_pc2 = self.w_pc2.value() / 100.0
         
@@ -1165,182 +1634,186 @@ class PCApp(QMainWindow):
         if self.price_slider.value() == 100:
             max_price = float('inf')
         
-        self.df["is_affordable"] = self.df["price"] <= max_price
-        
-        # スコア計算用のデータセット（予算内があればそれ、なければ全体）
-        score_df = self.df[self.df["is_affordable"]] if self.df["is_affordable"].any() else self.df
+        # 同じデータ・同じ重みと予算なら前回の結果がそのまま使える
+        # （同じプリセットの再選択、元の位置でスライダーを離した時など）
+        score_key = (w_pc1, w_pc2, max_price)
+        if score_key == self._last_score_key:
+            return False
+        self._last_score_key = score_key
         
-        # PC1とPC2を正規化（同じスケールで評価するため）
-        pc1_min = score_df["PC1"].min()
-        pc1_max = score_df["PC1"].max()
-        if pc1_max - pc1_min > 1e-9:
-            pc1_norm = (score_df["PC1"] - pc1_min) / (pc1_max - pc1_min)  # 0-1に正規化
-            pc1_scaled = (pc1_norm - 0.5) * 2  # -1～+1の範囲に変換
-        else:
-            pc1_scaled = 0
+        self._affordable = affordable = self._price_arr <= max_price
         
-        pc2_min = score_df["PC2"].min()
-        pc2_max = score_df["PC2"].max()
-        if pc2_max - pc2_min > 1e-9:
-            pc2_norm = (score_df["PC2"] - pc2_min) / (pc2_max - pc2_min)  # 0-1に正規化
-            pc2_scaled = (pc2_norm - 0.5) * 2  # -1～+1の範囲に変換
-        else:
-            pc2_scaled = 0
+        # スコア計算用の行（予算内があればそれ、なければ全体）
+        rows = affordable if affordable.any() else np.ones_like(affordable)
         
+        # PC1とPC2を対象行の範囲で-1～+1に変換（同じスケールで評価するため）し、
         # スコア = PC1の嗜好(50%) + PC2の嗜好(50%)
         # 両軸とも-1～+1の範囲で同等に評価（データサイエンス的に正しい）
-        self.df.loc[score_df.index, "score"] = 0.5 * w_pc1 * pc1_scaled + 0.5 * w_pc2 * pc2_scaled
+        w = np.array([0.5 * w_pc1, 0.5 * w_pc2])
         
         # 最高スコアのPCを選択（予算内優先）
-        if self.df["is_affordable"].any():
-            self.best_pc = self.df[self.df["is_affordable"]].sort_values("score", ascending=False).iloc[0]
-        else:
-            self.best_pc = self.df.sort_values("score", ascending=False).iloc[0]
+        self._best_idx = best = score_best(self._pcs, rows, w, self._scores)
+        self.best_pc = self._pc_row(best)
+        return True
+
+    def _pc_row(self, idx):
+        """idx行目のPCの情報（予算判定・スコアを含む）を1行分のdictで返す"""
+        # pandasの行アクセスは使わず、列ごとの配列から位置で取り出す
+        row = {col: values[idx] for col, values in self._columns.items()}
+        row["is_affordable"] = bool(self._affordable[idx])
+        row["score"] = self._scores[idx]
+        return row
 
     def _update_visualization(self):
         """グラフの更新：PCA空間（構成の偏り）を可視化"""
         if not HAS_MATPLOTLIB or not hasattr(self, "pca"):
             return
-            
-        # 現在の表示範囲を保持（スライダー操作で表示が飛ばないようにする）
-        xlim = self.ax.get_xlim()
-        ylim = self.ax.get_ylim()
         
+        # 分析し直した時だけ軸を作り直す
+        # スライダー操作では予算外の表示と推奨PCだけを更新してブリットする
+        if self._plot_dirty:
+            self._build_plot()
+        else:
+            self._update_plot_overlays()
+            self._blit_plot()
+
+    def _build_plot(self):
+        """散布図・カラーバー・凡例を作り直す（PCA実行後に1回）"""
         self.ax.clear()
         
         # 散布図の描画
         # 色：価格（安いほど明るい/高いほど暗い）
-        # サイズ：総合性能（大きいほど高性能）
-        # total_perfを正規化して適切なサイズ範囲（20-100）にマッピング
-        perf_min = self.df["total_perf"].min()
-        perf_max = self.df["total_perf"].max()
-        if perf_max - perf_min > 1e-9:
-            perf_norm = (self.df["total_perf"] - perf_min) / (perf_max - perf_min)
+        # サイズ：総合性能（大きいほど高性能、_run_pcaで計算済み）
+        # 価格→色の対応はカラーバーと共有する。点の色は予算に応じて
+        # 面の色だけを書き換えるので、基準の色（RGBA）を保持しておく
+        price_clim = (self._price_min, self._price_max)
+        if not hasattr(self, "_price_mappable"):
+            self._price_mappable = ScalarMappable(norm=Normalize(*price_clim), cmap="viridis_r")
         else:
-            perf_norm = 0.5
-        sizes = 20 + perf_norm * 80  # 20から100の範囲
-        
-        scatter = self.ax.scatter(
-            self.df["PC1"], self.df["PC2"],
-            c=self.df["price"], cmap="viridis_r",
-            s=sizes,
-            alpha=0.6, edgecolors="white", linewidth=0.5, label="PCモデル"
+            self._price_mappable.set_clim(*price_clim)
+        self._base_rgba = self._price_mappable.to_rgba(self._price_arr, alpha=0.6)
+        
+        # 全PCを1つの散布図で描く。予算外のPC（グレーアウト）と推奨PCはスライダーで変わるので、
+        # 背景とは別に描画する（animated=True）
+        self._main_scatter = self.ax.scatter(
+            self._pcs[:, 0], self._pcs[:, 1],
+            c=self._base_rgba,
+            s=self._plot_sizes,
+            edgecolors=(1.0, 1.0, 1.0, 0.6), linewidth=0.5, label="PCモデル",
+            animated=True
         )
-        
-        # 予算外のPCをグレーアウト
-        out_of_budget = self.df[~self.df["is_affordable"]]
-        if not out_of_budget.empty:
-            out_perf_norm = (out_of_budget["total_perf"] - perf_min) / (perf_max - perf_min + 1e-9)
-            out_sizes = 20 + out_perf_norm * 80
-            self.ax.scatter(
-                out_of_budget["PC1"], out_of_budget["PC2"],
-                c="lightgray", s=out_sizes,
-                alpha=0.3, edgecolors="none", zorder=2
-            )
-
-        # 推奨PCを強調
-        best_perf_norm = (self.best_pc["total_perf"] - perf_min) / (perf_max - perf_min + 1e-9)
-        best_size = 50 + best_perf_norm * 150  # 50から200の範囲（目立たせる）
-        self.ax.scatter(
-            self.best_pc["PC1"], self.best_pc["PC2"],
-            c="red", s=best_size,
-            marker="*", edgecolors="yellow", linewidth=1.5, zorder=10, label="推奨PC"
+        self._best_marker = self.ax.scatter(
+            [], [],
+            c="red",
+            marker="*", edgecolors="yellow", linewidth=1.5, zorder=10, label="推奨PC",
+            animated=True
         )
+        self._update_plot_overlays()
         
         # 軸ラベルとタイトルの設定
         self.ax.set_xlabel(self.pc1_desc, fontsize=FontSize.GRAPH_AXIS, fontweight='bold')
         self.ax.set_ylabel(self.pc2_desc, fontsize=FontSize.GRAPH_AXIS, fontweight='bold')
         self.ax.set_title("PC構成分析 (PCA空間)", fontsize=FontSize.GRAPH_TITLE, fontweight='bold')
         
-        # カラーバーの更新（既存の軸を再利用して「つぶれ」を防止）
+        # カラーバーは初回だけ作成（既存の軸を再利用して「つぶれ」を防止）
+        # 価格の範囲が変わった時はset_climの通知で自動的に更新される
         if not hasattr(self, "cax"):
             from mpl_toolkits.axes_grid1 import make_axes_locatable
             divider = make_axes_locatable(self.ax)
             self.cax = divider.append_axes("right", size="5%", pad=0.1)
-            self.colorbar = self.fig.colorbar(scatter, cax=self.cax, label="価格 (円)")
-        else:
-            # 2回目以降は既存のカラーバーを更新
-            self.colorbar.update_normal(scatter)
+            self.colorbar = self.fig.colorbar(self._price_mappable, cax=self.cax, label="価格 (円)")
             
         self.ax.grid(True, alpha=0.2)
         self.ax.legend(loc='best', fontsize=FontSize.GRAPH_LEGEND)
+        self.fig.tight_layout()
         
-        # 範囲の固定（同じ分析結果を表示している間のみ）
-        if hasattr(self, "_prev_pca_id") and self._prev_pca_id == id(self.pca):
-            self.ax.set_xlim(xlim)
-            self.ax.set_ylim(ylim)
-        else:
-            self._prev_pca_id = id(self.pca)
-            self.fig.tight_layout()
+        # 背景は次の全体描画（draw_event）で取り直す
+        self._plot_bg = None
+        self._plot_dirty = False
+        self.canvas.draw_idle()
+
+    def _update_plot_overlays(self):
+        """予算外のPCの色と推奨PCのマーカー位置・サイズを更新"""
+        # 予算外の点だけ面の色をグレーに置き換える（1回のベクトル代入）
+        out_of_budget = ~self._affordable
+        rgba = self._base_rgba.copy()
+        rgba[out_of_budget] = OUT_OF_BUDGET_RGBA
+        self._main_scatter.set_facecolors(rgba)
         
-        self.canvas.draw()
+        # 推奨PCを強調
+        best = self._best_idx
+        self._best_marker.set_offsets(self._pcs[best:best + 1])
+        self._best_marker.set_sizes(self._best_sizes[best:best + 1])
 
-    def _update_info_panels(self):
-        """左右のパネルを更新"""
-        # 左パネル
+    def _draw_plot_overlays(self):
+        self.ax.draw_artist(self._main_scatter)
+        self.ax.draw_artist(self._best_marker)
+
+    def _on_canvas_draw(self, event):
+        """全体描画の直後に背景を保存し、スライダーで変わるマーカーを重ねる"""
+        if not hasattr(self, "_best_marker") or self.canvas.is_saving():
+            return
+        self._plot_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_plot_overlays()
+
+    def _blit_plot(self):
+        """保存済みの背景にマーカーだけを描き直して転送"""
+        if self._plot_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._plot_bg)
+        self._draw_plot_overlays()
+        self.canvas.blit(self.ax.bbox)
+
+    def _update_pca_panel(self):
+        """左パネル（PCA結果）を更新。PCAを実行した時だけ呼ぶ"""
         self.pca_panel.update_pca_info(
             self.pca, 
-            self.pca.explained_variance_ratio_,
+            self._var_ratio,
             pc1_desc=self.pc1_desc,
             pc2_desc=self.pc2_desc
         )
-        
-        # 右パネル
-        self.recommendation_panel.update_recommendation(
-            best_pc=self.best_pc,
-            preset_name=self.current_preset_name,
-            w_pc1=self.w_pc1.value() / 100.0,
-            w_pc2=self.w_pc2.value() / 100.0
-        )
+
+    def _update_info_panels(self):
+        """右パネルとプリセットボタンを更新（スライダー操作のたびに呼ぶ）"""
+        # 右パネル（表示内容が前回と同じなら更新しない。予算だけ動かした時など）
+        w_pc1 = self.w_pc1.value() / 100.0
+        w_pc2 = self.w_pc2.value() / 100.0
+        rec_key = (self._best_idx, float(self._scores[self._best_idx]),
+                   self.current_preset_name, w_pc1, w_pc2)
+        if rec_key != self._last_rec_key:
+            self.recommendation_panel.update_recommendation(
+                best_pc=self.best_pc,
+                preset_name=self.current_preset_name,
+                w_pc1=w_pc1,
+                w_pc2=w_pc2
+            )
+            self._last_rec_key = rec_key
         
         # プリセットボタンのハイライト更新
         self._update_preset_button_styles()
 
     def _update_preset_button_styles(self):
-        """選択中のプリセットボタンを強調表示"""
+        """選択中のプリセットボタンを強調表示（状態が変わったボタンだけ再ポリッシュ）"""
         for name, btn in self.preset_buttons.items():
-            preset = PRESETS[name]
-            if name == self.current_preset_name:
-                # 選択中：背景を白、文字をプリセット色、太い枠線
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: white;
-                        color: {preset['color']};
-                        font-size: {FontSize.BTN_PRESET}px;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        border: 4px solid {preset['color']};
-                        padding: 6px 10px;
-                    }}
-                """)
-            else:
-                # 非選択：通常スタイル
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {preset['color']};
-                        color: white;
-                        font-size: {FontSize.BTN_PRESET}px;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        border: 2px solid {preset['color']};
-                        padding: 6px 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: white;
-                        color: {preset['color']};
-                        border: 3px solid {preset['color']};
-                    }}
-                """)
+            selected = name == self.current_preset_name
+            if btn.property("selected") == selected:
+                continue
+            btn.setProperty("selected", selected)
+            style = btn.style()
+            style.unpolish(btn)
+            style.polish(btn)
 
     def on_point_click(self, event):
         """グラフ上の点をクリックしてモデル詳細を表示"""
         if not hasattr(self, "df") or event.inaxes != self.ax:
             return
         
-        # PCA空間で最も近い点を探す
-        dists = (self.df["PC1"] - event.xdata)**2 + (self.df["PC2"] - event.ydata)**2
-        idx = dists.idxmin()
-        row = self.df.loc[idx]
+        # PCA空間で最も近い点を探す（保持している主成分得点をそのまま使う）
+        dx = self._pcs[:, 0] - event.xdata
+        dy = self._pcs[:, 1] - event.ydata
+        idx = int(np.argmin(dx * dx + dy * dy))
+        row = self._pc_row(idx)
         
         # 推奨PCかどうかを判定
         is_best = False
@@ -1371,11 +1844,45 @@ class PCApp(QMainWindow):
                 path = f.read().strip()
             
             if path and os.path.exists(path):
-                if self.csv_tab.load_csv_to_table(path):
+                loaded = self._load_last_csv_cache(path)
+                if not loaded and self.csv_tab.load_csv_to_table(path):
+                    self._save_last_csv_cache(path)
+                    loaded = True
+                if loaded:
                     self.csv_tab.current_csv_path = path
                     # 初回起動時も分析を実行
                     self.analyze_from_manager()
 
+    def _load_last_csv_cache(self, path):
+        """元CSVと同一と確認できるParquetキャッシュがあればテーブルに読み込む"""
+        if not HAS_PARQUET or not os.path.exists(LAST_CSV_CACHE):
+            return False
+        # 保存時に記録した元CSVの (パス, mtime_ns, サイズ) が完全一致する場合のみ有効
+        # （mtimeの前後比較だと、古い日付のまま差し替えられたCSVを見逃す）
+        try:
+            meta = pq.read_schema(LAST_CSV_CACHE).metadata or {}
+            source = meta.get(LAST_CSV_CACHE_SOURCE_KEY)
+            if source is None or json.loads(source) != list(CSVManager._file_state(path)):
+                return False
+            df = pd.read_parquet(LAST_CSV_CACHE)
+        except Exception:
+            return False
+        self.csv_tab.model.setDataFrame(df)
+        self.csv_tab.mark_synced(path)
+        return True
+
+    def _save_last_csv_cache(self, path):
+        """テーブル内容を元CSVの情報付きでParquetキャッシュに保存（失敗しても無視）"""
+        if not HAS_PARQUET:
+            return
+        try:
+            table = pa.Table.from_pandas(self.csv_tab.model.dataFrame(), preserve_index=False)
+            source = json.dumps(list(CSVManager._file_state(path))).encode("utf-8")
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), LAST_CSV_CACHE_SOURCE_KEY: source})
+            pq.write_table(table, LAST_CSV_CACHE)
+        except Exception:
+            pass
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)